@@ -9,7 +9,7 @@ Tests cover:
 """
 import time
 import unittest
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import patch, Mock
 import requests
 
 from utils.datadog_api import (
@@ -18,7 +18,6 @@ from utils.datadog_api import (
     DataDogAuthError,
     DataDogRateLimitError,
     DataDogTimeoutError,
-    LogEntry,
     SearchResult,
 )
 
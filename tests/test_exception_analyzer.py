@@ -8,7 +8,6 @@ Tests cover:
 - Exception-specific fix suggestions
 """
 import unittest
-from typing import List, Dict, Optional
 
 
 # Sample diff for testing correlation
@@ -37,7 +36,7 @@ class TestCallFlowBuilding(unittest.TestCase):
 
     def test_build_call_flow_ordering(self):
         """Test that call flow is built in correct order (deepest to shallowest)."""
-        from agents.exception_analyzer import ExceptionAnalyzer, CallFlowStep
+        from agents.exception_analyzer import ExceptionAnalyzer
         from utils.stack_trace_parser import ParsedStackTrace, StackFrame
 
         frames = [
@@ -79,7 +78,7 @@ class TestLineCorrelation(unittest.TestCase):
 
     def test_correlate_direct_line_match(self):
         """Test correlation when stack frame line directly matches changed line."""
-        from agents.exception_analyzer import ExceptionAnalyzer, LineCorrelation
+        from agents.exception_analyzer import ExceptionAnalyzer
         from utils.stack_trace_parser import StackFrame
 
         frame = StackFrame(
@@ -150,7 +149,7 @@ class TestRootCauseExplanation(unittest.TestCase):
 
     def test_generate_explanation_for_npe(self):
         """Test generating explanation for NullPointerException."""
-        from agents.exception_analyzer import ExceptionAnalyzer, ExceptionAnalysis
+        from agents.exception_analyzer import ExceptionAnalyzer
         from utils.stack_trace_parser import ParsedStackTrace, StackFrame
 
         frames = [
@@ -10,18 +10,21 @@ Logging format:
 - Two levels: DEBUG (full details) and INFO (summaries)
 - Sensitive data redaction: API keys, tokens, authorization headers
 """
-import json
 import logging
+import re
 import subprocess
 import unittest
 from typing import List
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import requests
 
 from utils.datadog_api import DataDogAPI
 from utils.github_helper import GitHubHelper
 
+# Matches the timing field of [HTTP_RESP] / [GH_CLI_RESP] summary lines
+TIMING_PATTERN = re.compile(r"timing=(\d+)ms")
+
 
 class LogCaptureHandler(logging.Handler):
     """Custom logging handler to capture log records during tests."""
@@ -382,8 +385,7 @@ class TestDataDogHTTPLogging(unittest.TestCase):
         self.assertIn("ms", resp_msg)
 
         # Extract timing value (should be >= 0)
-        import re
-        timing_match = re.search(r"timing=(\d+)ms", resp_msg)
+        timing_match = TIMING_PATTERN.search(resp_msg)
         self.assertIsNotNone(timing_match)
         timing_value = int(timing_match.group(1))
         self.assertGreaterEqual(timing_value, 0)
@@ -638,8 +640,7 @@ class TestGitHubCLILogging(unittest.TestCase):
         self.assertIn("ms", resp_msg)
 
         # Extract timing value (should be >= 0)
-        import re
-        timing_match = re.search(r"timing=(\d+)ms", resp_msg)
+        timing_match = TIMING_PATTERN.search(resp_msg)
         self.assertIsNotNone(timing_match)
         timing_value = int(timing_match.group(1))
         self.assertGreaterEqual(timing_value, 0)
@@ -7,23 +7,107 @@ Tests for:
 - Time utilities (utils/time_utils.py)
 - DataDog API client initialization (utils/datadog_api.py)
 """
+import logging
 import os
 import tempfile
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytz
 
+from utils.config import (
+    ConfigurationError,
+    get_cached_config,
+    load_config,
+    reset_config_cache,
+)
+from utils.datadog_api import (
+    DataDogAPI,
+    DataDogAPIError,
+    DataDogAuthError,
+    DataDogRateLimitError,
+    DataDogTimeoutError,
+    LogEntry,
+    SearchResult,
+)
+from utils.logger import configure_logging, get_logger, reset_logging
+from utils.time_utils import (
+    TEL_AVIV_TZ,
+    calculate_time_window,
+    datetime_to_iso8601,
+    datetime_to_milliseconds,
+    expand_time_window,
+    milliseconds_to_datetime,
+    parse_relative_time,
+    parse_time,
+    tel_aviv_to_utc,
+    utc_to_tel_aviv,
+)
+
+# Winter (UTC+2) reference instant for the timezone conversion tests
+FEB_10_TEL_AVIV = TEL_AVIV_TZ.localize(datetime(2026, 2, 10, 14, 0, 0))  # 14:00 Tel Aviv
+FEB_10_UTC = pytz.UTC.localize(datetime(2026, 2, 10, 12, 0, 0))  # 12:00 UTC
+
+
+# Raw DataDog logs search response (structure based on design doc)
+SAMPLE_DATADOG_LOG_RESPONSE = {
+    "data": [
+        {
+            "id": "log-id-1",
+            "type": "log",
+            "attributes": {
+                "service": "card-invitation-service",
+                "message": "Test log message",
+                "status": "info",
+                "timestamp": "2026-02-10T19:03:43.990Z",
+                "attributes": {
+                    "dd": {
+                        "service": "card-invitation-service",
+                        "env": "prod",
+                        "version": "08b9cd7acf38ddf65e3e470bbb27137fe682323e___618",
+                    },
+                    "efilogid": "-1-OTQ1NWU2MzEtNGQwNC00ZTE4LWE1Y2ItM2M3OGNkMmE4OGUw",
+                    "logger_name": "com.sunbit.card.invitation.lead.application.EntitledCustomerService",
+                },
+            },
+        }
+    ]
+}
+
+
+def setUpModule():
+    """Route root logging to a NullHandler so only TestLogger touches log files.
+
+    Importing utils.* auto-configures logging with a file handler on
+    logs/agent.log; the config, time and DataDog tests don't need it.
+    """
+    reset_logging()
+    logging.getLogger().addHandler(logging.NullHandler())
+
+
+def tearDownModule():
+    """Drop the NullHandler, leaving logging unconfigured as TestLogger does."""
+    reset_logging()
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned to FEB_10_UTC, for relative-time tests."""
+
+    @classmethod
+    def now(cls, tz=None):
+        if tz is None:
+            return FEB_10_UTC.replace(tzinfo=None)
+        return FEB_10_UTC.astimezone(tz)
+
 
 class TestConfig(unittest.TestCase):
-    """Tests for configuration loading and validation."""
+    """Tests for configuration loading and validation.
 
-    def setUp(self):
-        """Reset config cache before each test."""
-        from utils.config import reset_config_cache
-        reset_config_cache()
+    load_config() never consults the singleton cache, so only the test that
+    exercises get_cached_config() resets it.
+    """
 
     def test_config_loads_from_env(self):
         """Test that config loads environment variables correctly."""
@@ -38,7 +122,6 @@ class TestConfig(unittest.TestCase):
         }
 
         with patch.dict(os.environ, test_env, clear=False):
-            from utils.config import load_config
             config = load_config()
 
             self.assertEqual(config.anthropic_api_key, "test-anthropic-key")
@@ -58,33 +141,19 @@ class TestConfig(unittest.TestCase):
             "GITHUB_TOKEN": "test-key",
         }
 
-        # Clear optional vars
-        env_to_clear = ["DATADOG_SITE", "LOG_LEVEL", "TIMEZONE"]
-        clean_env = {k: v for k, v in test_env.items()}
-        for key in env_to_clear:
-            clean_env[key] = ""
-
-        with patch.dict(os.environ, clean_env, clear=False):
-            # Remove the keys to test defaults
-            with patch.dict(os.environ, {k: "" for k in env_to_clear}):
-                os.environ.pop("DATADOG_SITE", None)
-                os.environ.pop("LOG_LEVEL", None)
-                os.environ.pop("TIMEZONE", None)
+        with patch.dict(os.environ, test_env):
+            # Remove the optional vars; patch.dict restores them on exit
+            for key in ("DATADOG_SITE", "LOG_LEVEL", "TIMEZONE"):
+                os.environ.pop(key, None)
 
-                from utils.config import load_config
-                config = load_config()
+            config = load_config()
 
-                self.assertEqual(config.datadog_site, "datadoghq.com")
-                self.assertEqual(config.log_level, "INFO")
-                self.assertEqual(config.timezone, "Asia/Tel_Aviv")
+            self.assertEqual(config.datadog_site, "datadoghq.com")
+            self.assertEqual(config.log_level, "INFO")
+            self.assertEqual(config.timezone, "Asia/Tel_Aviv")
 
     def test_config_raises_on_missing_required(self):
         """Test that config raises error for missing required variables."""
-        from utils.config import load_config, ConfigurationError, reset_config_cache
-
-        # Reset config cache first
-        reset_config_cache()
-
         test_env = {
             "ANTHROPIC_API_KEY": "test-key",
             # Missing DATADOG_API_KEY - set to placeholder value
@@ -109,8 +178,8 @@ class TestConfig(unittest.TestCase):
         }
 
         with patch.dict(os.environ, test_env, clear=False):
-            from utils.config import get_cached_config, reset_config_cache
             reset_config_cache()
+            self.addCleanup(reset_config_cache)
 
             config1 = get_cached_config()
             config2 = get_cached_config()
@@ -121,88 +190,96 @@ class TestConfig(unittest.TestCase):
 class TestLogger(unittest.TestCase):
     """Tests for logging infrastructure."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary log directory shared by the class."""
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.log_dir = Path(cls._tmpdir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared log directory."""
+        cls._tmpdir.cleanup()
+
+    def _log_path(self, *parts: str) -> Path:
+        """Return a log file path unique to the running test."""
+        return self.log_dir.joinpath(self._testMethodName, *parts)
+
+    def _read_log(self, log_file: Path) -> str:
+        """Flush the root handlers and return the log file contents."""
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        return log_file.read_text(encoding="utf-8")
+
     def setUp(self):
         """Reset logging before each test."""
-        from utils.logger import reset_logging
         reset_logging()
 
     def tearDown(self):
         """Clean up after each test."""
-        from utils.logger import reset_logging
         reset_logging()
 
     def test_get_logger_returns_logger(self):
         """Test that get_logger returns a logger instance."""
-        from utils.logger import get_logger
-        import logging
-
-        logger = get_logger("test_module")
+        # get_logger() auto-configures logging; keep its default file in the temp dir
+        with patch("utils.logger.DEFAULT_LOG_FILE", str(self._log_path("agent.log"))):
+            logger = get_logger("test_module")
 
         self.assertIsInstance(logger, logging.Logger)
         self.assertEqual(logger.name, "test_module")
 
     def test_logger_creates_log_file(self):
         """Test that logger creates log file in correct location."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
+        log_file = self._log_path("test.log")
 
-            from utils.logger import configure_logging, get_logger
-            configure_logging(log_file=str(log_file))
+        configure_logging(log_file=str(log_file))
 
-            logger = get_logger("test")
-            logger.info("Test message")
+        logger = get_logger("test")
+        logger.info("Test message")
 
-            self.assertTrue(log_file.exists())
+        self.assertTrue(log_file.exists())
 
     def test_logger_creates_directory(self):
         """Test that logger creates log directory if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "subdir" / "test.log"
+        log_file = self._log_path("subdir", "test.log")
 
-            from utils.logger import configure_logging, get_logger
-            configure_logging(log_file=str(log_file))
+        configure_logging(log_file=str(log_file))
 
-            logger = get_logger("test")
-            logger.info("Test message")
+        logger = get_logger("test")
+        logger.info("Test message")
 
-            self.assertTrue(log_file.parent.exists())
+        self.assertTrue(log_file.parent.exists())
 
     def test_logger_respects_log_level(self):
         """Test that logger respects configured log level."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
+        log_file = self._log_path("test.log")
 
-            from utils.logger import configure_logging, get_logger
-            configure_logging(log_level="ERROR", log_file=str(log_file))
+        configure_logging(log_level="ERROR", log_file=str(log_file))
 
-            logger = get_logger("test")
-            logger.info("Info message - should not appear")
-            logger.error("Error message - should appear")
+        logger = get_logger("test")
+        logger.info("Info message - should not appear")
+        logger.error("Error message - should appear")
 
-            with open(log_file) as f:
-                content = f.read()
+        content = self._read_log(log_file)
 
-            self.assertNotIn("Info message", content)
-            self.assertIn("Error message", content)
+        self.assertNotIn("Info message", content)
+        self.assertIn("Error message", content)
 
     def test_logger_format(self):
         """Test that logger uses correct format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
+        log_file = self._log_path("test.log")
 
-            from utils.logger import configure_logging, get_logger
-            configure_logging(log_file=str(log_file))
+        configure_logging(log_file=str(log_file))
 
-            logger = get_logger("test_module")
-            logger.info("Test message")
+        logger = get_logger("test_module")
+        logger.info("Test message")
 
-            with open(log_file) as f:
-                content = f.read()
+        content = self._read_log(log_file)
 
-            # Check format: [timestamp] [name] [level] message
-            self.assertIn("[test_module]", content)
-            self.assertIn("[INFO]", content)
-            self.assertIn("Test message", content)
+        # Check format: [timestamp] [name] [level] message
+        self.assertIn("[test_module]", content)
+        self.assertIn("[INFO]", content)
+        self.assertIn("Test message", content)
 
 
 class TestTimeUtils(unittest.TestCase):
@@ -210,8 +287,6 @@ class TestTimeUtils(unittest.TestCase):
 
     def test_parse_time_iso8601(self):
         """Test parsing ISO 8601 format."""
-        from utils.time_utils import parse_time
-
         result = parse_time("2026-02-10T14:30:00")
 
         self.assertEqual(result.year, 2026)
@@ -222,8 +297,6 @@ class TestTimeUtils(unittest.TestCase):
 
     def test_parse_time_human_readable(self):
         """Test parsing human-readable format."""
-        from utils.time_utils import parse_time
-
         result = parse_time("February 10, 2026 2:30 PM")
 
         self.assertEqual(result.year, 2026)
@@ -233,8 +306,6 @@ class TestTimeUtils(unittest.TestCase):
 
     def test_tel_aviv_to_utc_naive(self):
         """Test converting naive datetime (assumed Tel Aviv) to UTC."""
-        from utils.time_utils import tel_aviv_to_utc
-
         # Tel Aviv is UTC+2 in winter, UTC+3 in summer
         # February is winter (UTC+2)
         tel_aviv_dt = datetime(2026, 2, 10, 14, 0, 0)  # 14:00 Tel Aviv
@@ -245,32 +316,23 @@ class TestTimeUtils(unittest.TestCase):
 
     def test_tel_aviv_to_utc_aware(self):
         """Test converting aware datetime to UTC."""
-        from utils.time_utils import tel_aviv_to_utc
-
-        tel_aviv_tz = pytz.timezone("Asia/Tel_Aviv")
-        tel_aviv_dt = tel_aviv_tz.localize(datetime(2026, 2, 10, 14, 0, 0))
-        utc_dt = tel_aviv_to_utc(tel_aviv_dt)
+        utc_dt = tel_aviv_to_utc(FEB_10_TEL_AVIV)
 
         self.assertEqual(utc_dt.tzinfo, pytz.UTC)
+        self.assertEqual(utc_dt, FEB_10_UTC)
 
     def test_utc_to_tel_aviv(self):
         """Test converting UTC to Tel Aviv."""
-        from utils.time_utils import utc_to_tel_aviv
-
-        utc_dt = pytz.UTC.localize(datetime(2026, 2, 10, 12, 0, 0))  # 12:00 UTC
-        tel_aviv_dt = utc_to_tel_aviv(utc_dt)
+        tel_aviv_dt = utc_to_tel_aviv(FEB_10_UTC)
 
         self.assertEqual(tel_aviv_dt.hour, 14)  # Should be 14:00 Tel Aviv (winter)
 
     def test_datetime_to_milliseconds(self):
         """Test converting datetime to Unix milliseconds."""
-        from utils.time_utils import datetime_to_milliseconds
-
-        dt = pytz.UTC.localize(datetime(2026, 2, 10, 12, 0, 0))
+        dt = FEB_10_UTC
         ms = datetime_to_milliseconds(dt)
 
         # Convert back and verify
-        from utils.time_utils import milliseconds_to_datetime
         result = milliseconds_to_datetime(ms)
 
         self.assertEqual(result.year, dt.year)
@@ -281,57 +343,31 @@ class TestTimeUtils(unittest.TestCase):
 
     def test_datetime_to_iso8601(self):
         """Test converting datetime to ISO 8601 string."""
-        from utils.time_utils import datetime_to_iso8601
-
         dt = pytz.UTC.localize(datetime(2026, 2, 10, 14, 30, 0))
         result = datetime_to_iso8601(dt)
 
         self.assertEqual(result, "2026-02-10T14:30:00Z")
 
+    @patch("utils.time_utils.datetime", _FrozenDatetime)
     def test_parse_relative_time_now(self):
         """Test parsing 'now' relative time."""
-        from utils.time_utils import parse_relative_time
-
-        before = datetime.now(pytz.UTC)
         result = parse_relative_time("now")
-        after = datetime.now(pytz.UTC)
-
-        self.assertGreaterEqual(result, before)
-        self.assertLessEqual(result, after)
 
-    def test_parse_relative_time_hours_ago(self):
-        """Test parsing 'now-Xh' relative time."""
-        from utils.time_utils import parse_relative_time
-
-        now = datetime.now(pytz.UTC)
-        result = parse_relative_time("now-4h")
-
-        expected = now - timedelta(hours=4)
-        # Allow 1 second tolerance
-        self.assertAlmostEqual(
-            result.timestamp(),
-            expected.timestamp(),
-            delta=1,
-        )
+        self.assertEqual(result, FEB_10_UTC)
 
-    def test_parse_relative_time_days_ago(self):
-        """Test parsing 'now-Xd' relative time."""
-        from utils.time_utils import parse_relative_time
-
-        now = datetime.now(pytz.UTC)
-        result = parse_relative_time("now-7d")
-
-        expected = now - timedelta(days=7)
-        self.assertAlmostEqual(
-            result.timestamp(),
-            expected.timestamp(),
-            delta=1,
-        )
+    @patch("utils.time_utils.datetime", _FrozenDatetime)
+    def test_parse_relative_time_offsets(self):
+        """Test parsing 'now-Xh' and 'now-Xd' relative times."""
+        cases = [
+            ("now-4h", pytz.UTC.localize(datetime(2026, 2, 10, 8, 0, 0))),
+            ("now-7d", pytz.UTC.localize(datetime(2026, 2, 3, 12, 0, 0))),
+        ]
+        for time_str, expected in cases:
+            with self.subTest(time_str=time_str):
+                self.assertEqual(parse_relative_time(time_str), expected)
 
     def test_calculate_time_window_no_datetime(self):
         """Test calculate_time_window with no datetime (default)."""
-        from utils.time_utils import calculate_time_window
-
         from_time, to_time = calculate_time_window(None)
 
         self.assertEqual(from_time, "now-4h")
@@ -339,8 +375,6 @@ class TestTimeUtils(unittest.TestCase):
 
     def test_calculate_time_window_with_datetime(self):
         """Test calculate_time_window with user datetime."""
-        from utils.time_utils import calculate_time_window
-
         # Use a past time to avoid future cap
         user_dt = datetime(2026, 1, 10, 12, 0, 0)  # Naive, assumed Tel Aviv
         from_time, to_time = calculate_time_window(user_dt)
@@ -350,7 +384,6 @@ class TestTimeUtils(unittest.TestCase):
         self.assertTrue(to_time.endswith("Z"))
 
         # Parse and verify window is +/- 2 hours
-        from utils.time_utils import parse_relative_time
         from_dt = parse_relative_time(from_time)
         to_dt = parse_relative_time(to_time)
 
@@ -358,35 +391,26 @@ class TestTimeUtils(unittest.TestCase):
         # Window should be at most 4 hours (could be less if capped at now)
         self.assertLessEqual(window.total_seconds(), 4 * 3600 + 1)
 
-    def test_expand_time_window_level1_no_datetime(self):
-        """Test expand_time_window level 1 without datetime."""
-        from utils.time_utils import expand_time_window
-
-        from_time, to_time = expand_time_window("now-4h", "now", 1, None)
-
-        self.assertEqual(from_time, "now-24h")
-        self.assertEqual(to_time, "now")
-
-    def test_expand_time_window_level2_no_datetime(self):
-        """Test expand_time_window level 2 without datetime."""
-        from utils.time_utils import expand_time_window
+    def test_expand_time_window_no_datetime(self):
+        """Test expand_time_window levels 1 and 2 without datetime."""
+        cases = [
+            (1, "now-4h", "now-24h"),
+            (2, "now-24h", "now-7d"),
+        ]
+        for level, current_from, expected_from in cases:
+            with self.subTest(level=level):
+                from_time, to_time = expand_time_window(current_from, "now", level, None)
 
-        from_time, to_time = expand_time_window("now-24h", "now", 2, None)
-
-        self.assertEqual(from_time, "now-7d")
-        self.assertEqual(to_time, "now")
+                self.assertEqual(from_time, expected_from)
+                self.assertEqual(to_time, "now")
 
     def test_expand_time_window_invalid_level(self):
         """Test expand_time_window with invalid level raises error."""
-        from utils.time_utils import expand_time_window
-
         with self.assertRaises(ValueError):
             expand_time_window("now-4h", "now", 3, None)
 
     def test_time_window_never_future(self):
         """Test that time windows are never expanded into the future."""
-        from utils.time_utils import calculate_time_window, expand_time_window, parse_relative_time
-
         # Use current time as user datetime
         now = datetime.now(pytz.UTC)
 
@@ -406,10 +430,13 @@ class TestTimeUtils(unittest.TestCase):
 class TestDataDogAPI(unittest.TestCase):
     """Tests for DataDog API client."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one default-site client shared by tests that don't mutate it."""
+        cls.client = DataDogAPI(api_key="test-api-key", app_key="test-app-key")
+
     def test_client_initialization(self):
         """Test that DataDog client initializes correctly."""
-        from utils.datadog_api import DataDogAPI
-
         client = DataDogAPI(
             api_key="test-api-key",
             app_key="test-app-key",
@@ -422,53 +449,37 @@ class TestDataDogAPI(unittest.TestCase):
 
     def test_client_default_site(self):
         """Test that client uses default site."""
-        from utils.datadog_api import DataDogAPI
-
-        client = DataDogAPI(
-            api_key="test-api-key",
-            app_key="test-app-key",
-        )
-
-        self.assertEqual(client.base_url, "https://api.datadoghq.com")
+        self.assertEqual(self.client.base_url, "https://api.datadoghq.com")
 
     def test_client_headers(self):
         """Test that client sets correct headers."""
-        from utils.datadog_api import DataDogAPI
-
-        client = DataDogAPI(
-            api_key="test-api-key",
-            app_key="test-app-key",
-        )
-
-        self.assertEqual(client.headers["DD-API-KEY"], "test-api-key")
-        self.assertEqual(client.headers["DD-APPLICATION-KEY"], "test-app-key")
-        self.assertEqual(client.headers["Content-Type"], "application/json")
-        self.assertEqual(client.headers["Accept"], "application/json")
-
-    def test_build_log_message_query(self):
-        """Test building query for log message search."""
-        from utils.datadog_api import DataDogAPI
-
-        client = DataDogAPI(api_key="key", app_key="key")
-        query = client.build_log_message_query("Error processing request")
-
-        self.assertIn("env:prod", query)
-        self.assertIn("pod_label_team:card", query)
-        self.assertIn('"Error processing request"', query)
-
-    def test_build_identifiers_query(self):
-        """Test building query for identifiers search."""
-        from utils.datadog_api import DataDogAPI
-
-        client = DataDogAPI(api_key="key", app_key="key")
-        query = client.build_identifiers_query(["12345", "67890", "ABC123"])
-
-        self.assertIn("env:prod", query)
-        self.assertIn("pod_label_team:card", query)
-        self.assertIn("12345", query)
-        self.assertIn("67890", query)
-        self.assertIn("ABC123", query)
-        self.assertIn(" OR ", query)
+        headers = self.client.headers
+
+        self.assertEqual(headers["DD-API-KEY"], "test-api-key")
+        self.assertEqual(headers["DD-APPLICATION-KEY"], "test-app-key")
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(headers["Accept"], "application/json")
+
+    def test_build_search_queries(self):
+        """Test building queries for log message and identifiers search."""
+        cases = [
+            (
+                "build_log_message_query",
+                "Error processing request",
+                ["env:prod", "pod_label_team:card", '"Error processing request"'],
+            ),
+            (
+                "build_identifiers_query",
+                ["12345", "67890", "ABC123"],
+                ["env:prod", "pod_label_team:card", "12345", "67890", "ABC123", " OR "],
+            ),
+        ]
+        for method, arg, expected_parts in cases:
+            with self.subTest(method=method):
+                query = getattr(self.client, method)(arg)
+
+                for part in expected_parts:
+                    self.assertIn(part, query)
 
     def test_build_efilogid_query(self):
         """Test building query for efilogid search.
@@ -476,45 +487,13 @@ class TestDataDogAPI(unittest.TestCase):
         The query should wrap the efilogid in quotes (unescaped in Python).
         When JSON-serialized, these quotes will be properly escaped.
         """
-        from utils.datadog_api import DataDogAPI
-
-        client = DataDogAPI(api_key="key", app_key="key")
-        query = client.build_efilogid_query("test-session-id")
+        query = self.client.build_efilogid_query("test-session-id")
 
         self.assertEqual(query, '@efilogid:"test-session-id"')
 
     def test_extract_log_data(self):
         """Test extracting log data from API response."""
-        from utils.datadog_api import DataDogAPI
-
-        client = DataDogAPI(api_key="key", app_key="key")
-
-        # Mock response structure (based on design doc)
-        mock_response = {
-            "data": [
-                {
-                    "id": "log-id-1",
-                    "type": "log",
-                    "attributes": {
-                        "service": "card-invitation-service",
-                        "message": "Test log message",
-                        "status": "info",
-                        "timestamp": "2026-02-10T19:03:43.990Z",
-                        "attributes": {
-                            "dd": {
-                                "service": "card-invitation-service",
-                                "env": "prod",
-                                "version": "08b9cd7acf38ddf65e3e470bbb27137fe682323e___618",
-                            },
-                            "efilogid": "-1-OTQ1NWU2MzEtNGQwNC00ZTE4LWE1Y2ItM2M3OGNkMmE4OGUw",
-                            "logger_name": "com.sunbit.card.invitation.lead.application.EntitledCustomerService",
-                        },
-                    },
-                }
-            ]
-        }
-
-        extracted = client.extract_log_data(mock_response)
+        extracted = self.client.extract_log_data(SAMPLE_DATADOG_LOG_RESPONSE)
 
         self.assertEqual(len(extracted), 1)
         log = extracted[0]
@@ -536,8 +515,6 @@ class TestDataDogAPI(unittest.TestCase):
 
     def test_log_entry_dataclass(self):
         """Test LogEntry dataclass structure."""
-        from utils.datadog_api import LogEntry
-
         entry = LogEntry(
             id="test-id",
             message="Test message",
@@ -555,8 +532,6 @@ class TestDataDogAPI(unittest.TestCase):
 
     def test_search_result_dataclass(self):
         """Test SearchResult dataclass structure."""
-        from utils.datadog_api import SearchResult, LogEntry
-
         log = LogEntry(id="1", message="test")
         result = SearchResult(
             logs=[log],
@@ -573,27 +548,19 @@ class TestDataDogAPI(unittest.TestCase):
 class TestDataDogAPIErrors(unittest.TestCase):
     """Tests for DataDog API error handling."""
 
-    def test_auth_error_exception(self):
-        """Test that DataDogAuthError is properly defined."""
-        from utils.datadog_api import DataDogAuthError, DataDogAPIError
-
-        error = DataDogAuthError("Test auth error")
-        self.assertIsInstance(error, DataDogAPIError)
-        self.assertEqual(str(error), "Test auth error")
-
-    def test_rate_limit_error_exception(self):
-        """Test that DataDogRateLimitError is properly defined."""
-        from utils.datadog_api import DataDogRateLimitError, DataDogAPIError
-
-        error = DataDogRateLimitError("Rate limit exceeded")
-        self.assertIsInstance(error, DataDogAPIError)
-
-    def test_timeout_error_exception(self):
-        """Test that DataDogTimeoutError is properly defined."""
-        from utils.datadog_api import DataDogTimeoutError, DataDogAPIError
-
-        error = DataDogTimeoutError("Request timed out")
-        self.assertIsInstance(error, DataDogAPIError)
+    def test_error_classes_subclass_api_error(self):
+        """Test that the specific DataDog errors are DataDogAPIError subclasses."""
+        cases = [
+            (DataDogAuthError, "Test auth error"),
+            (DataDogRateLimitError, "Rate limit exceeded"),
+            (DataDogTimeoutError, "Request timed out"),
+        ]
+        for error_cls, message in cases:
+            with self.subTest(error_cls=error_cls.__name__):
+                error = error_cls(message)
+
+                self.assertIsInstance(error, DataDogAPIError)
+                self.assertEqual(str(error), message)
 
 
 if __name__ == "__main__":
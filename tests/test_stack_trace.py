@@ -9,7 +9,7 @@ Tests are organized by phase:
 - Phase 5: Report generator stack trace section
 """
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 # Sample stack traces for testing
 SAMPLE_STACK_TRACE = """java.lang.RuntimeException: Error processing event
@@ -334,9 +334,9 @@ class TestStackTraceParser(unittest.TestCase):
         self.assertGreater(len(result.sunbit_frames), 0)
 
         # Should find CustomerRepository and BankruptcyService
-        class_names = [f.class_name for f in result.sunbit_frames]
-        self.assertTrue(any("CustomerRepository" in cn for cn in class_names))
-        self.assertTrue(any("BankruptcyService" in cn for cn in class_names))
+        class_names = " ".join(f.class_name for f in result.sunbit_frames)
+        self.assertIn("CustomerRepository", class_names)
+        self.assertIn("BankruptcyService", class_names)
 
     def test_extract_file_paths_convenience_function(self):
         """Test the convenience function extract_file_paths."""